@@ -13,14 +13,160 @@ Reads blueprint.json and emits modular JSON files:
 
 Each file is kept under 10 KB for optimal LLM consumption.
 
-Python 3.11+ compatible, standard library only.
+Python 3.11+ compatible, standard library only. Uses orjson for
+serialization when it is installed.
 """
 
 import json
-import hashlib
+import os
+import sys
 from datetime import datetime, timezone
+from hashlib import sha256 as _sha256
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_EQ60 = "=" * 60
+_DASH60 = "-" * 60
+
+# Default skeletons for altitude levels missing from the blueprint. Shared
+# across emits and only ever serialized, so they must never be mutated.
+_ALT_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "30000": {
+        "project_name": "",
+        "objective": "",
+        "success_criteria": (),
+        "stakeholders": ()
+    },
+    "20000": {
+        "components": (),
+        "roles": (),
+        "stages": (),
+        "inputs": (),
+        "outputs": ()
+    },
+    "10000": {
+        "steps": (),
+        "apis_services": (),
+        "decision_points": (),
+        "llms": (),
+        "compliance": ()
+    },
+    "5000": {
+        "documentation_plan": (),
+        "agent_roles": {},
+        "handoffs": (),
+        "firebreak_queue": {}
+    }
+}
+
+# Schema-enforcement substring -> database entry, in match priority order
+# (read-only, see _ALT_DEFAULTS)
+_DB_PROVIDERS = (
+    ("Neon", {"name": "PostgreSQL", "provider": "Neon", "purpose": "vault"}),
+    ("Firebase", {"name": "Firebase", "provider": "Google", "purpose": "workbench"}),
+    ("BigQuery", {"name": "BigQuery", "provider": "Google", "purpose": "warehouse"}),
+)
+
+# Fixed CTB branch schema (read-only, see _ALT_DEFAULTS)
+_CTB_BRANCHES = (
+    {
+        "name": "doctrine",
+        "category": "governance",
+        "nodes": (
+            {"id": "doctrine-001", "label": "HEIR Compliance", "type": "validation"},
+            {"id": "doctrine-002", "label": "ORBT Discipline", "type": "process"}
+        )
+    },
+    {
+        "name": "input",
+        "category": "data_ingestion",
+        "nodes": ()
+    },
+    {
+        "name": "middle",
+        "category": "orchestration",
+        "nodes": ()
+    },
+    {
+        "name": "output",
+        "category": "delivery",
+        "nodes": ()
+    }
+)
+
+
+def _dumps_json(data: Any) -> Tuple[bytes, str]:
+    """
+    Serialize data as 2-space indented UTF-8 JSON.
+
+    Uses orjson when available. Its output is equivalent JSON, but floats may
+    be formatted differently and NaN/Infinity become null, so the encoder name
+    is returned for the manifest. Payloads orjson rejects (e.g. integers wider
+    than 64 bits) fall back to the stdlib encoder.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Tuple of (encoded JSON document, encoder name: "orjson" or "json")
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS), "orjson"
+        except orjson.JSONEncodeError:
+            pass
+
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'), "json"
+
+
+def _write_bytes_fast(path: Path, buf: bytes) -> None:
+    """
+    Write bytes to path with a raw file descriptor.
+
+    Bypasses Python's buffered/text I/O layers since the payload is already
+    fully encoded in memory.
+
+    Args:
+        path: Destination file (created or truncated)
+        buf: Encoded file content
+    """
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(buf)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _write_if_changed(path: Path, buf: bytes) -> bool:
+    """
+    Write bytes to path unless the file already holds exactly that content.
+
+    Leaves unchanged files (and their mtimes) untouched on no-op re-runs.
+    A size mismatch skips reading the existing file altogether.
+
+    Args:
+        path: Destination file
+        buf: Encoded file content
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if path.stat().st_size == len(buf) and path.read_bytes() == buf:
+            return False
+    except OSError:
+        pass
+
+    _write_bytes_fast(path, buf)
+    return True
 
 
 class BlueprintEmitter:
@@ -37,11 +183,15 @@ class BlueprintEmitter:
         self.blueprint_path = blueprint_path
         self.output_dir = output_dir
         self.blueprint_data: Dict[str, Any] = {}
+        # Single timestamp shared by every file emitted in this run
+        self._generated_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
         self.manifest: Dict[str, Any] = {
-            "generated_at": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            "generated_at": self._generated_at,
             "source_blueprint": str(blueprint_path),
             "files": {}
         }
+        # Running sum of manifest["files"] sizes, kept in step by _record_file
+        self._total_size = 0
 
     def load_blueprint(self) -> bool:
         """
@@ -55,8 +205,8 @@ class BlueprintEmitter:
             return False
 
         try:
-            with open(self.blueprint_path, 'r', encoding='utf-8') as f:
-                self.blueprint_data = json.load(f)
+            raw = self.blueprint_path.read_bytes()
+            self.blueprint_data = json.loads(raw)
             print(f"[OK] Loaded blueprint: {self.blueprint_path}")
             return True
         except json.JSONDecodeError as e:
@@ -77,34 +227,17 @@ class BlueprintEmitter:
         """
         altitudes = self.blueprint_data.get("altitudes", {})
 
+        if "30000" in altitudes:
+            altitude_30k = altitudes["30000"]
+        else:
+            altitude_30k = {**_ALT_DEFAULTS["30000"], "project_name": self.blueprint_data.get("project_slug", "")}
+
         altitude_data = {
             "altitudes": {
-                "30000": altitudes.get("30000", {
-                    "project_name": self.blueprint_data.get("project_slug", ""),
-                    "objective": "",
-                    "success_criteria": [],
-                    "stakeholders": []
-                }),
-                "20000": altitudes.get("20000", {
-                    "components": [],
-                    "roles": [],
-                    "stages": [],
-                    "inputs": [],
-                    "outputs": []
-                }),
-                "10000": altitudes.get("10000", {
-                    "steps": [],
-                    "apis_services": [],
-                    "decision_points": [],
-                    "llms": [],
-                    "compliance": []
-                }),
-                "5000": altitudes.get("5000", {
-                    "documentation_plan": [],
-                    "agent_roles": {},
-                    "handoffs": [],
-                    "firebreak_queue": {}
-                })
+                "30000": altitude_30k,
+                "20000": altitudes.get("20000", _ALT_DEFAULTS["20000"]),
+                "10000": altitudes.get("10000", _ALT_DEFAULTS["10000"]),
+                "5000": altitudes.get("5000", _ALT_DEFAULTS["5000"])
             },
             "meta": self.blueprint_data.get("meta", {})
         }
@@ -119,8 +252,9 @@ class BlueprintEmitter:
             True if emission successful
         """
         # Extract IMO structure from blueprint
-        altitudes_10k = self.blueprint_data.get("altitudes", {}).get("10000", {})
-        altitudes_20k = self.blueprint_data.get("altitudes", {}).get("20000", {})
+        altitudes = self.blueprint_data.get("altitudes", {})
+        altitudes_10k = altitudes.get("10000", {})
+        altitudes_20k = altitudes.get("20000", {})
 
         imo_data = {
             "input": {
@@ -182,31 +316,7 @@ class BlueprintEmitter:
                 "unique_id": meta.get("unique_id", ""),
                 "blueprint_version": meta.get("blueprint_version_hash", "")
             },
-            "branches": [
-                {
-                    "name": "doctrine",
-                    "category": "governance",
-                    "nodes": [
-                        {"id": "doctrine-001", "label": "HEIR Compliance", "type": "validation"},
-                        {"id": "doctrine-002", "label": "ORBT Discipline", "type": "process"}
-                    ]
-                },
-                {
-                    "name": "input",
-                    "category": "data_ingestion",
-                    "nodes": []
-                },
-                {
-                    "name": "middle",
-                    "category": "orchestration",
-                    "nodes": []
-                },
-                {
-                    "name": "output",
-                    "category": "delivery",
-                    "nodes": []
-                }
-            ],
+            "branches": _CTB_BRANCHES,
             "schema_foundation": trunk_root.get("schema_enforcement", []),
             "telemetry": trunk_root.get("telemetry", {})
         }
@@ -221,18 +331,17 @@ class BlueprintEmitter:
             True if emission successful
         """
         # Infer stack from blueprint data
+        meta = self.blueprint_data.get("meta", {})
         trunk_root = self.blueprint_data.get("trunk_root", {})
         schemas = trunk_root.get("schema_enforcement", [])
 
-        # Parse databases from schema enforcement
+        # Parse databases from schema enforcement (first matching provider wins)
         databases = []
         for schema in schemas:
-            if "Neon" in schema:
-                databases.append({"name": "PostgreSQL", "provider": "Neon", "purpose": "vault"})
-            elif "Firebase" in schema:
-                databases.append({"name": "Firebase", "provider": "Google", "purpose": "workbench"})
-            elif "BigQuery" in schema:
-                databases.append({"name": "BigQuery", "provider": "Google", "purpose": "warehouse"})
+            for token, database in _DB_PROVIDERS:
+                if token in schema:
+                    databases.append(database)
+                    break
 
         stack_data = {
             "languages": [
@@ -257,7 +366,7 @@ class BlueprintEmitter:
                 "mcp_servers": ["composio", "firebase", "github"],
                 "apis": []
             },
-            "doctrine": self.blueprint_data.get("meta", {}).get("doctrine", [])
+            "doctrine": meta.get("doctrine", [])
         }
 
         return self._write_json_file("04_stack.json", stack_data)
@@ -272,39 +381,42 @@ class BlueprintEmitter:
         meta = self.blueprint_data.get("meta", {})
         altitudes = self.blueprint_data.get("altitudes", {})
         altitude_30k = altitudes.get("30000", {})
+        altitude_20k = altitudes.get("20000", {})
+        altitude_10k = altitudes.get("10000", {})
+        altitude_5k = altitudes.get("5000", {})
 
         prompt_lines = [
-            "=" * 60,
+            _EQ60,
             "BLUEPRINT BUILD INSTRUCTIONS",
-            "=" * 60,
+            _EQ60,
             "",
             f"Project: {altitude_30k.get('project_name', self.blueprint_data.get('project_slug', 'Unnamed'))}",
             f"Objective: {altitude_30k.get('objective', 'Not specified')}",
             f"Blueprint Version: {meta.get('blueprint_version_hash', 'N/A')}",
             "",
-            "-" * 60,
+            _DASH60,
             "ALTITUDE BREAKDOWN",
-            "-" * 60,
+            _DASH60,
             "",
             "30,000 ft - STRATEGIC VISION",
             f"  Stakeholders: {', '.join(altitude_30k.get('stakeholders', ['None listed']))}",
             f"  Success Criteria: {len(altitude_30k.get('success_criteria', []))} defined",
             "",
             "20,000 ft - SYSTEM ARCHITECTURE",
-            f"  Components: {len(altitudes.get('20000', {}).get('components', []))} components",
-            f"  Roles: {len(altitudes.get('20000', {}).get('roles', []))} roles",
+            f"  Components: {len(altitude_20k.get('components', []))} components",
+            f"  Roles: {len(altitude_20k.get('roles', []))} roles",
             "",
             "10,000 ft - IMPLEMENTATION",
-            f"  Steps: {len(altitudes.get('10000', {}).get('steps', []))} implementation steps",
-            f"  APIs/Services: {len(altitudes.get('10000', {}).get('apis_services', []))} integrations",
+            f"  Steps: {len(altitude_10k.get('steps', []))} implementation steps",
+            f"  APIs/Services: {len(altitude_10k.get('apis_services', []))} integrations",
             "",
             "5,000 ft - TACTICAL EXECUTION",
-            f"  Agent Roles: {len(altitudes.get('5000', {}).get('agent_roles', {}))} agents",
-            f"  Handoffs: {len(altitudes.get('5000', {}).get('handoffs', []))} handoff points",
+            f"  Agent Roles: {len(altitude_5k.get('agent_roles', {}))} agents",
+            f"  Handoffs: {len(altitude_5k.get('handoffs', []))} handoff points",
             "",
-            "-" * 60,
+            _DASH60,
             "DOCTRINE ENFORCEMENT",
-            "-" * 60,
+            _DASH60,
             "",
         ]
 
@@ -314,9 +426,9 @@ class BlueprintEmitter:
 
         prompt_lines.extend([
             "",
-            "-" * 60,
+            _DASH60,
             "BUILD SEQUENCE",
-            "-" * 60,
+            _DASH60,
             "",
             "1. Validate all gates (make gate)",
             "2. Set up infrastructure from 04_stack.json",
@@ -325,9 +437,9 @@ class BlueprintEmitter:
             "5. Follow altitude plan from 01_altitude.json",
             "6. Deploy per 06_ci_config.json",
             "",
-            "=" * 60,
-            f"Generated: {datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')}",
-            "=" * 60,
+            _EQ60,
+            f"Generated: {self._generated_at}",
+            _EQ60,
             ""
         ])
 
@@ -400,21 +512,54 @@ class BlueprintEmitter:
             "files": self.manifest["files"],
             "summary": {
                 "total_files": len(self.manifest["files"]),
-                "total_size_bytes": sum(f["size_bytes"] for f in self.manifest["files"].values())
+                "total_size_bytes": self._total_size
             }
         }
 
         # Write manifest without adding itself to manifest
         output_path = self.output_dir / "manifest.json"
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest_data, f, indent=2, ensure_ascii=False)
-            print(f"[OK] Emitted: manifest.json")
+            payload, _ = _dumps_json(manifest_data)
+            written = _write_if_changed(output_path, payload)
+            print(f"[OK] {'Emitted' if written else 'Unchanged'}: manifest.json")
             return True
         except Exception as e:
             print(f"[FAIL] Failed to emit manifest.json: {e}")
             return False
 
+    def _record_file(
+        self,
+        filename: str,
+        sha256_hash: str,
+        size_bytes: int,
+        file_type: str,
+        encoder: Optional[str] = None
+    ) -> None:
+        """
+        Add or replace a manifest entry and keep the running size total in step.
+
+        Args:
+            filename: Output filename
+            sha256_hash: Hex digest of the written bytes
+            size_bytes: Number of bytes written
+            file_type: MIME type recorded in the manifest
+            encoder: JSON encoder that produced the bytes, for JSON files
+        """
+        previous = self.manifest["files"].get(filename)
+        if previous is not None:
+            self._total_size -= previous["size_bytes"]
+
+        entry = {
+            "sha256": sha256_hash,
+            "size_bytes": size_bytes,
+            "type": file_type
+        }
+        if encoder is not None:
+            # Hashes differ between encoders, so record which one was used
+            entry["encoder"] = encoder
+        self.manifest["files"][filename] = entry
+        self._total_size += size_bytes
+
     def _write_json_file(self, filename: str, data: Dict[str, Any]) -> bool:
         """
         Write JSON data to file and update manifest.
@@ -429,21 +574,17 @@ class BlueprintEmitter:
         output_path = self.output_dir / filename
 
         try:
-            json_str = json.dumps(data, indent=2, ensure_ascii=False)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_str)
+            payload, encoder = _dumps_json(data)
+            written = _write_if_changed(output_path, payload)
 
             # Calculate SHA256 hash
-            sha256_hash = hashlib.sha256(json_str.encode('utf-8')).hexdigest()
+            sha256_hash = _sha256(payload).hexdigest()
+            size_bytes = len(payload)
 
             # Update manifest
-            self.manifest["files"][filename] = {
-                "sha256": sha256_hash,
-                "size_bytes": len(json_str.encode('utf-8')),
-                "type": "application/json"
-            }
+            self._record_file(filename, sha256_hash, size_bytes, "application/json", encoder)
 
-            print(f"[OK] Emitted: {filename} ({len(json_str)} bytes)")
+            print(f"[OK] {'Emitted' if written else 'Unchanged'}: {filename} ({size_bytes} bytes)")
             return True
 
         except Exception as e:
@@ -464,20 +605,16 @@ class BlueprintEmitter:
         output_path = self.output_dir / filename
 
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            content_bytes = content.encode('utf-8')
+            written = _write_if_changed(output_path, content_bytes)
 
             # Calculate SHA256 hash
-            sha256_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            sha256_hash = _sha256(content_bytes).hexdigest()
 
             # Update manifest
-            self.manifest["files"][filename] = {
-                "sha256": sha256_hash,
-                "size_bytes": len(content.encode('utf-8')),
-                "type": "text/plain"
-            }
+            self._record_file(filename, sha256_hash, len(content_bytes), "text/plain")
 
-            print(f"[OK] Emitted: {filename} ({len(content)} bytes)")
+            print(f"[OK] {'Emitted' if written else 'Unchanged'}: {filename} ({len(content_bytes)} bytes)")
             return True
 
         except Exception as e:
@@ -491,12 +628,15 @@ class BlueprintEmitter:
         Returns:
             True if all emissions successful
         """
-        print("=" * 60)
-        print("Blueprint Engine - Emit Steps")
-        print("=" * 60)
-        print(f"Source: {self.blueprint_path}")
-        print(f"Output: {self.output_dir}")
-        print()
+        # Batch console output per phase into single writes
+        sys.stdout.write(
+            f"{_EQ60}\n"
+            "Blueprint Engine - Emit Steps\n"
+            f"{_EQ60}\n"
+            f"Source: {self.blueprint_path}\n"
+            f"Output: {self.output_dir}\n"
+            "\n"
+        )
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -505,9 +645,7 @@ class BlueprintEmitter:
         if not self.load_blueprint():
             return False
 
-        print()
-        print("Emitting modular files...")
-        print("-" * 60)
+        sys.stdout.write(f"\nEmitting modular files...\n{_DASH60}\n")
 
         # Emit all files
         results = [
@@ -522,20 +660,15 @@ class BlueprintEmitter:
         # Emit manifest last
         results.append(self.emit_manifest())
 
-        print("-" * 60)
-
-        if all(results):
-            print(f"[SUCCESS] All files emitted to {self.output_dir}")
-            return True
-        else:
-            print("[FAILURE] Some files failed to emit")
-            return False
+        success = all(results)
+        status = f"[SUCCESS] All files emitted to {self.output_dir}" if success else "[FAILURE] Some files failed to emit"
+        sys.stdout.write(f"{_DASH60}\n{status}\n")
+        sys.stdout.flush()
+        return success
 
 
 def main():
     """Main entry point for emit steps."""
-    import sys
-
     if len(sys.argv) < 3:
         print("Usage: python emit_steps.py <blueprint.json> <output_dir>")
         print("Example: python emit_steps.py ../../blueprint.json ../../blueprints/sample_blueprint")
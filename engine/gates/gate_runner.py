@@ -19,6 +19,23 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+# Required top-level keys per gate, in reporting order. For 01_altitude.json
+# these are the levels under the 'altitudes' root object.
+_REQUIRED: Dict[str, Tuple[str, ...]] = {
+    "01_altitude.json": ("30000", "20000", "10000", "5000"),
+    "02_imo.json": ("input", "middle", "output"),
+    "03_ctb.json": ("heir_canopy", "star", "branches"),
+    "04_stack.json": ("languages", "frameworks", "deployment"),
+}
+_REQUIRED_SETS: Dict[str, frozenset] = {name: frozenset(fields) for name, fields in _REQUIRED.items()}
+
+# Fields that must be present and non-empty at 30,000 ft
+_REQUIRED_30K = ("project_name", "objective")
+
+# HEIR canopy fields (missing ones are warnings, not errors)
+_HEIR_FIELDS = ("history", "enforcement", "integrity", "repair")
+_HEIR_FIELDS_SET = frozenset(_HEIR_FIELDS)
+
 
 class GateRunner:
     """Validates blueprint JSON files against required schema."""
@@ -34,6 +51,28 @@ class GateRunner:
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
+    def _check_required(self, filename: str, data: Dict[str, Any], message: str) -> bool:
+        """
+        Report required keys from _REQUIRED that are absent in data.
+
+        Args:
+            filename: Gate filename (key into _REQUIRED)
+            data: Object whose keys are checked
+            message: Error template; '{}' is replaced with the missing key
+
+        Returns:
+            True if no required key is missing
+        """
+        keys = data.keys() if isinstance(data, dict) else frozenset()
+        missing = _REQUIRED_SETS[filename] - keys
+        if not missing:
+            return True
+
+        for field in _REQUIRED[filename]:
+            if field in missing:
+                self.errors.append(f"{filename}: {message.format(field)}")
+        return False
+
     def validate_altitude(self, data: Dict[str, Any]) -> bool:
         """
         Validate 01_altitude.json structure.
@@ -50,16 +89,14 @@ class GateRunner:
         Returns:
             True if validation passes, False otherwise
         """
-        passed = True
-
         if "altitudes" not in data:
             self.errors.append("01_altitude.json: Missing 'altitudes' root object")
             return False
 
+        passed = True
         altitudes = data["altitudes"]
-        required_levels = ["30000", "20000", "10000", "5000"]
 
-        for level in required_levels:
+        for level in _REQUIRED["01_altitude.json"]:
             if level not in altitudes:
                 self.errors.append(f"01_altitude.json: Missing altitude level '{level}'")
                 passed = False
@@ -69,11 +106,15 @@ class GateRunner:
 
         # Validate 30000 ft required fields
         if "30000" in altitudes:
-            required_30k = ["project_name", "objective"]
-            for field in required_30k:
-                if field not in altitudes["30000"] or not altitudes["30000"][field]:
-                    self.errors.append(f"01_altitude.json: Missing required field 'altitudes.30000.{field}'")
-                    passed = False
+            altitude_30k = altitudes["30000"]
+            if isinstance(altitude_30k, dict):
+                missing = [f for f in _REQUIRED_30K if not altitude_30k.get(f)]
+            else:
+                missing = list(_REQUIRED_30K)
+            for field in missing:
+                self.errors.append(f"01_altitude.json: Missing required field 'altitudes.30000.{field}'")
+            if missing:
+                passed = False
 
         return passed
 
@@ -93,9 +134,8 @@ class GateRunner:
             True if validation passes, False otherwise
         """
         passed = True
-        required_sections = ["input", "middle", "output"]
 
-        for section in required_sections:
+        for section in _REQUIRED["02_imo.json"]:
             if section not in data:
                 self.errors.append(f"02_imo.json: Missing required section '{section}'")
                 passed = False
@@ -125,20 +165,14 @@ class GateRunner:
         Returns:
             True if validation passes, False otherwise
         """
-        passed = True
-        required_sections = ["heir_canopy", "star", "branches"]
-
-        for section in required_sections:
-            if section not in data:
-                self.errors.append(f"03_ctb.json: Missing required section '{section}'")
-                passed = False
+        passed = self._check_required("03_ctb.json", data, "Missing required section '{}'")
 
         # Validate HEIR canopy
         if "heir_canopy" in data:
             heir = data["heir_canopy"]
-            required_heir = ["history", "enforcement", "integrity", "repair"]
-            for field in required_heir:
-                if field not in heir:
+            missing = _HEIR_FIELDS_SET.difference(heir.keys() if isinstance(heir, dict) else ())
+            for field in _HEIR_FIELDS:
+                if field in missing:
                     self.warnings.append(f"03_ctb.json: HEIR canopy missing '{field}' field")
 
         # Validate branches structure
@@ -167,13 +201,7 @@ class GateRunner:
         Returns:
             True if validation passes, False otherwise
         """
-        passed = True
-        required_sections = ["languages", "frameworks", "deployment"]
-
-        for section in required_sections:
-            if section not in data:
-                self.errors.append(f"04_stack.json: Missing required section '{section}'")
-                passed = False
+        passed = self._check_required("04_stack.json", data, "Missing required section '{}'")
 
         # Validate deployment configuration
         if "deployment" in data:
@@ -201,8 +229,8 @@ class GateRunner:
             return False, {}
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            raw = file_path.read_bytes()
+            data = json.loads(raw)
         except json.JSONDecodeError as e:
             self.errors.append(f"{filename}: Invalid JSON - {e}")
             return False, {}
@@ -220,11 +248,13 @@ class GateRunner:
         Returns:
             True if all gates pass, False if any fail
         """
-        print("=" * 60)
-        print("Blueprint Engine - Gate Validation")
-        print("=" * 60)
-        print(f"Validating blueprints in: {self.blueprints_dir}")
-        print()
+        sys.stdout.write(
+            f"{'=' * 60}\n"
+            "Blueprint Engine - Gate Validation\n"
+            f"{'=' * 60}\n"
+            f"Validating blueprints in: {self.blueprints_dir}\n"
+            "\n"
+        )
 
         gates = [
             ("01_altitude.json", self.validate_altitude),
@@ -235,41 +265,43 @@ class GateRunner:
 
         all_passed = True
 
+        # Written before loading so an unexpected exception shows which gate it hit
         for filename, validator in gates:
-            print(f"Gate: {filename}...", end=" ")
+            sys.stdout.write(f"Gate: {filename}... ")
             passed, _ = self.load_and_validate(filename, validator)
 
             if passed:
-                print("[PASS]")
+                sys.stdout.write("[PASS]\n")
             else:
-                print("[FAIL]")
+                sys.stdout.write("[FAIL]\n")
                 all_passed = False
 
-        print()
-        print("-" * 60)
+        # Collect the summary and write it in one go
+        lines = ["", "-" * 60]
 
         # Report errors
         if self.errors:
-            print(f"ERRORS ({len(self.errors)}):")
-            for error in self.errors:
-                print(f"  [X] {error}")
-            print()
+            lines.append(f"ERRORS ({len(self.errors)}):")
+            lines.extend(f"  [X] {error}" for error in self.errors)
+            lines.append("")
 
         # Report warnings
         if self.warnings:
-            print(f"WARNINGS ({len(self.warnings)}):")
-            for warning in self.warnings:
-                print(f"  [!] {warning}")
-            print()
+            lines.append(f"WARNINGS ({len(self.warnings)}):")
+            lines.extend(f"  [!] {warning}" for warning in self.warnings)
+            lines.append("")
 
-        print("-" * 60)
+        lines.append("-" * 60)
 
-        if all_passed and not self.errors:
-            print("Result: [SUCCESS] ALL GATES PASSED")
-            return True
+        success = all_passed and not self.errors
+        if success:
+            lines.append("Result: [SUCCESS] ALL GATES PASSED")
         else:
-            print("Result: [FAILURE] VALIDATION FAILED")
-            return False
+            lines.append("Result: [FAILURE] VALIDATION FAILED")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        return success
 
 
 def main():